@@ -1,10 +1,13 @@
+import asyncio
 from typing import Optional, List
 
 from fastapi import APIRouter, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.params import Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from app.api.shortcuts import delete_by_key_or_404, get_by_key_or_404
+from app.api.scheduler_client import scheduler_client
+from app.api.shortcuts import delete_by_key_or_404, get_by_key_or_404, get_many_by_key_or_404
 from app.core.sample import GetSampleException, get_dataset_sample
 from app.core.users import current_active_user
 from app.db.client import get_client
@@ -15,21 +18,22 @@ from app.repositories.dataset import DatasetRepository, get_dataset_repository
 from app.repositories.datasource import DatasourceRepository, get_datasource_repository
 from app.repositories.expectation import ExpectationRepository, get_expectation_repository
 from app.repositories.validation import get_validation_repository, ValidationRepository
-from app.settings import settings
 from app.models.users import UserDB
 from app.core.runner import create_dataset_suggestions, run_dataset_validation
 from opensearchpy import OpenSearch, RequestError
-import requests
 
 router = APIRouter(
-    dependencies=[Depends(current_active_user)]
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(current_active_user)],
 )
 
+# The schema only depends on the model definition, so it is generated once per process.
+DATASET_JSON_SCHEMA = Dataset.schema()
+
 
 @router.get("/json-schema")
 def get_json_schema():
-    schema = Dataset.schema()
-    return JSONResponse(status_code=status.HTTP_200_OK, content=schema)
+    return DATASET_JSON_SCHEMA
 
 
 @router.get("", response_model=List[Dataset])
@@ -39,16 +43,15 @@ def list_datasets(
     asc: Optional[bool] = True,
     repository: DatasetRepository = Depends(get_dataset_repository),
 ):
-    # TODO implement scrolling
     direction = "asc" if asc else "desc"
 
     if datasource_id is None:
         query = {"query": {"match_all": {}}, "sort": [{sort_by_key: direction}]}
     else:
-        query = {"query": {"match": {"datasource_id": datasource_id}}, "sort": [{sort_by_key: direction}]}
+        query = {"query": {"term": {"datasource_id": datasource_id}}, "sort": [{sort_by_key: direction}]}
 
     try:
-        return repository.query(query, size=1000)
+        return repository.query_all(query)
     except RequestError:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -98,7 +101,8 @@ def update_dataset(
     datasource_repository: DatasourceRepository = Depends(get_datasource_repository),
     repository: DatasetRepository = Depends(get_dataset_repository),
 ):
-    dataset = get_by_key_or_404(key, repository)
+    # datasource_id can't change, so the datasource is fetched along with the dataset
+    dataset, datasource = get_many_by_key_or_404((key, repository), (dataset_update.datasource_id, datasource_repository))
 
     if dataset.datasource_id != dataset_update.datasource_id:
         raise HTTPException(
@@ -106,8 +110,6 @@ def update_dataset(
             detail="updates to dataset datasource_id are not supported",
         )
 
-    datasource = get_by_key_or_404(dataset.datasource_id, datasource_repository)
-
     update_dict = dataset_update.dict(exclude_unset=False, exclude_none=False, by_alias=True)
 
     if dataset.dataset_name != dataset_update.dataset_name:
@@ -127,32 +129,32 @@ def update_dataset(
 
 
 @router.delete("/{key}")
-def delete_dataset(
+async def delete_dataset(
     key: str,
     request: Request,
     repository: DatasetRepository = Depends(get_dataset_repository),
     expectation_repository: ExpectationRepository = Depends(get_expectation_repository),
     validation_repository: ValidationRepository = Depends(get_validation_repository)
 ):
-    get_by_key_or_404(key, repository)
-
-    validation_repository.delete_by_dataset(dataset_id=key)
-
-    # TODO: use an internal function for this rather than making an HTTP request
-    requests.delete(
-        url=f"{settings.SCHEDULER_API_URL}/api/v1/schedules",
-        params={"dataset_id": key},
-        headers=request.headers,
-        cookies=request.cookies,
+    await run_in_threadpool(get_by_key_or_404, key, repository)
+
+    # Validations, schedules and expectations are independent of each other, so clean them up concurrently.
+    # The dataset itself is deleted last so that it survives if any of the cleanups fail.
+    await asyncio.gather(
+        run_in_threadpool(validation_repository.delete_by_dataset, dataset_id=key),
+        # TODO: use an internal function for this rather than making an HTTP request
+        scheduler_client.delete(
+            url="/api/v1/schedules",
+            params={"dataset_id": key},
+            headers=request.headers,
+            cookies=request.cookies,
+        ),
+        run_in_threadpool(expectation_repository.delete_by_filter, dataset_id=key),
     )
 
-    expectation_repository.delete_by_filter(dataset_id=key)
-    delete_by_key_or_404(key, repository)
+    await run_in_threadpool(delete_by_key_or_404, key, repository)
 
-    return JSONResponse(
-        status_code=status.HTTP_200_OK,
-        content="dataset deleted"
-    )
+    return "dataset deleted"
 
 
 @router.post("/sample", response_model=Sample)
@@ -193,7 +195,7 @@ def update_sample(
 @router.post("/{key}/validate", response_model=Validation)
 def validate_dataset(key: str, client: OpenSearch = Depends(get_client)):
     try:
-        validation: Validation = run_dataset_validation(key, client)
+        validation: Validation = run_dataset_validation(key, client, refresh="wait_for")
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND) from e
 
@@ -232,13 +234,13 @@ def should_update_sample(dataset: Dataset, dataset_update: DatasetUpdate):
 
 def _check_dataset_does_not_exists(dataset: BaseDataset, repository: DatasetRepository):
     dataset_schema, dataset_name, _ = dataset.get_resource_names()
-    existing_datasources = repository.query_by_resource_name(
+    existing_datasets = repository.count_by_resource_name(
         datasource_name=dataset.datasource_name,
         schema=dataset_schema,
         name=dataset_name,
         virtual_name=dataset.dataset_name,
     )
-    if len(existing_datasources) > 0:
+    if existing_datasets > 0:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"dataset '{dataset.datasource_name}.{dataset_schema}.{dataset_name}' already exists"
@@ -3,10 +3,12 @@ from typing import Optional, get_args
 import requests
 import sqlalchemy.exc
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from opensearchpy import RequestError
 from sqlalchemy import create_engine
 
+from app.api.scheduler_client import scheduler_client
 from app.api.shortcuts import get_by_key_or_404
 from app.core.users import current_active_user
 from app.models.datasource import DatasourceInput, Datasource
@@ -15,7 +17,6 @@ from app.repositories.dataset import DatasetRepository, get_dataset_repository
 from app.repositories.datasource import DatasourceRepository, get_datasource_repository
 from app.repositories.expectation import ExpectationRepository, get_expectation_repository
 from app.repositories.validation import ValidationRepository, get_validation_repository
-from app.settings import settings
 from app import constants as c
 
 router = APIRouter(
@@ -128,7 +129,7 @@ def update_datasource(
 
 
 @router.delete("/{key}")
-def delete_datasource(
+async def delete_datasource(
         key: str,
         request: Request,
         repository: DatasourceRepository = Depends(get_datasource_repository),
@@ -136,20 +137,20 @@ def delete_datasource(
         expectation_repository: ExpectationRepository = Depends(get_expectation_repository),
         validation_repository: ValidationRepository = Depends(get_validation_repository),
 ):
-    get_by_key_or_404(key, repository)
-    validation_repository.delete_by_datasource(datasource_id=key)
-    expectation_repository.delete_by_datasource(key)
-    dataset_repository.delete_by_datasource(key)
+    await run_in_threadpool(get_by_key_or_404, key, repository)
+    await run_in_threadpool(validation_repository.delete_by_datasource, datasource_id=key)
+    await run_in_threadpool(expectation_repository.delete_by_datasource, key)
+    await run_in_threadpool(dataset_repository.delete_by_datasource, key)
 
     # TODO: use an internal function for this rather than making an HTTP request
-    requests.delete(
-        url=f"{settings.SCHEDULER_API_URL}/api/v1/schedules",
+    await scheduler_client.delete(
+        url="/api/v1/schedules",
         params={"datasource_id": key},
         headers=request.headers,
         cookies=request.cookies,
     )
 
-    repository.delete(key)
+    await run_in_threadpool(repository.delete, key)
     return JSONResponse(
         status_code=status.HTTP_200_OK,
         content="datasource deleted"
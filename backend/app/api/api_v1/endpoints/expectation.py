@@ -1,7 +1,12 @@
+import asyncio
 from typing import Optional, get_args
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
-from app.api.shortcuts import delete_by_key_or_404, get_by_key_or_404
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from app.api.shortcuts import (
+    delete_by_key_or_404, get_by_key_or_404, get_many_by_key_or_404, invalid_page_cursor, parse_page_cursor,
+    set_next_page_cursor,
+)
 from app.models.expectation import ExpectationInput, Expectation
 from app.core.expectations import supported_unsupported_expectations
 from app import utils
@@ -9,36 +14,38 @@ from app.models.validation import Validation
 from app.repositories.dataset import DatasetRepository, get_dataset_repository
 from app.repositories.datasource import DatasourceRepository, get_datasource_repository
 from app.repositories.expectation import ExpectationRepository, get_expectation_repository
-from app.repositories.validation import ValidationRepository, get_validation_repository
+from app.repositories.validation import (
+    MAX_VALIDATIONS_PAGE_SIZE, VALIDATIONS_PAGE_SIZE, ValidationRepository, get_validation_repository
+)
 from app.utils import json_schema_to_single_doc
 from fastapi.param_functions import Depends
+from opensearchpy import RequestError
 from app.core.users import current_active_user
 import app.constants as c
 
 
 router = APIRouter(
-    dependencies=[Depends(current_active_user)]
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(current_active_user)],
 )
 
 
+# The schemas only depend on the model definitions, so they are generated once per process.
+EXPECTATION_JSON_SCHEMAS = [json_schema_to_single_doc(expectation.schema()) for expectation in get_args(Expectation)]
+
+
 async def get_expectation_payload(expectation: ExpectationInput) -> Expectation:
     return expectation.__root__
 
 
 @router.get("/json-schema")
 def get_json_schema():
-    expectations = []
-    for expectation in get_args(Expectation):
-        json_schema = json_schema_to_single_doc(expectation.schema())
-        expectations.append(json_schema)
-
-    return JSONResponse(status_code=status.HTTP_200_OK, content=expectations)
+    return EXPECTATION_JSON_SCHEMAS
 
 
 @router.get("/supported")
 def list_supported_expectations():
-    content = supported_unsupported_expectations()
-    return JSONResponse(status_code=status.HTTP_200_OK, content=content)
+    return supported_unsupported_expectations()
 
 
 @router.put("/{expectation_id}/enable", response_model=Expectation)
@@ -62,9 +69,12 @@ def disable_expectation(
 
 @router.get("", response_model=list[Expectation])
 def list_expectations(
+        response: Response,
         datasource_id: Optional[str] = None,
         dataset_id: Optional[str] = None,
         include_history: Optional[bool] = False,
+        history_page_size: int = Query(VALIDATIONS_PAGE_SIZE, gt=0, le=MAX_VALIDATIONS_PAGE_SIZE),
+        history_after: Optional[str] = None,
         suggested: Optional[bool] = None,
         enabled: Optional[bool] = True,
         asc: Optional[bool] = False,
@@ -80,10 +90,17 @@ def list_expectations(
     )
 
     if include_history:
-        validations = validation_repository.query_by_filter(
-            datasource_id=datasource_id,
-            dataset_id=dataset_id,
-        )
+        # Only the validations are paged, every expectation is returned with each page of history
+        try:
+            validations, search_after = validation_repository.query_by_filter(
+                datasource_id=datasource_id,
+                dataset_id=dataset_id,
+                page_size=history_page_size,
+                search_after=parse_page_cursor(history_after),
+            )
+        except RequestError:
+            raise invalid_page_cursor()
+        set_next_page_cursor(response, search_after)
 
         return zip_expectations_and_validations(expectations, validations)
 
@@ -105,8 +122,10 @@ def create_expectation(
     datasource_repository: DatasourceRepository = Depends(get_datasource_repository),
     dataset_repository: DatasetRepository = Depends(get_dataset_repository),
 ):
-    get_by_key_or_404(expectation.datasource_id, datasource_repository)
-    dataset = get_by_key_or_404(expectation.dataset_id, dataset_repository)
+    _, dataset = get_many_by_key_or_404(
+        (expectation.datasource_id, datasource_repository),
+        (expectation.dataset_id, dataset_repository),
+    )
 
     if dataset.datasource_id != expectation.datasource_id:
         raise HTTPException(
@@ -148,7 +167,8 @@ def update_expectation(
     # run. We can't have an expectation with the same id but
     # with different expectation types
     if expectation.expectation_type != expectation_update.expectation_type:
-        new_expectation = repository.create(expectation_update.key, expectation_update)
+        # The delete below waits for a refresh of the index, which makes the new expectation visible as well
+        new_expectation = repository.create(expectation_update.key, expectation_update, refresh="false")
 
         repository.delete(expectation_id)
         validation_repository.delete_by_expectation(expectation_id)
@@ -158,37 +178,32 @@ def update_expectation(
 
 
 @router.delete("/{expectation_id}")
-def delete_expectation(
+async def delete_expectation(
     expectation_id: str,
     repository: ExpectationRepository = Depends(get_expectation_repository),
     validation_repository: ValidationRepository = Depends(get_validation_repository),
 ):
-    validation_repository.delete_by_expectation(expectation_id)
-    delete_by_key_or_404(expectation_id, repository)
-    return JSONResponse(
-        status_code=status.HTTP_200_OK,
-        content="expectation deleted"
+    # The two deletes are independent, so issue them concurrently rather than one after the other.
+    await asyncio.gather(
+        run_in_threadpool(validation_repository.delete_by_expectation, expectation_id),
+        run_in_threadpool(delete_by_key_or_404, expectation_id, repository),
     )
+    return "expectation deleted"
 
 
 def zip_expectations_and_validations(expectations: list[Expectation], validations: list[Validation]):
-    expectations_as_dict: dict[str, Expectation] = {}
-
-    for expectation in expectations:
-        expectations_as_dict[expectation.key] = expectation
+    expectations_as_dict: dict[str, Expectation] = {expectation.key: expectation for expectation in expectations}
 
     for validation in validations:
         run_time = utils.string_to_utc_time(validation.meta.run_id.run_time)
 
         for result in validation.results:
-            result_as_dict = result.dict()
-            result_as_dict["run_time"] = run_time
-
             # when an expectation is deleted, the corresponding validation results are not deleted. Instead, validations
             # should be expired/ deleted after some portion of time. For this reason, we only want to zip/join
             # a validation result to an expectation that hasn't been deleted.
-            if expectations_as_dict.get(result.expectation_id):
-                expectations_as_dict[result.expectation_id].validations.append(result_as_dict)
+            expectation = expectations_as_dict.get(result.expectation_id)
+            if expectation is not None:
+                expectation.validations.append({**result.dict(), "run_time": run_time})
 
     return list(expectations_as_dict.values())
 
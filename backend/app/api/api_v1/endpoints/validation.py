@@ -1,9 +1,13 @@
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from app.api.shortcuts import invalid_page_cursor, parse_page_cursor, set_next_page_cursor
 from app.models.validation import Validation, Stats
-from app.repositories.validation import ValidationRepository, get_validation_repository
+from app.repositories.validation import (
+    MAX_VALIDATIONS_PAGE_SIZE, VALIDATIONS_PAGE_SIZE, ValidationRepository, get_validation_repository
+)
 from fastapi.param_functions import Depends
+from opensearchpy import RequestError
 from app.core.users import current_active_user
 
 router = APIRouter(
@@ -13,8 +17,11 @@ router = APIRouter(
 
 @router.get("", response_model=list[Validation])
 def list_validations(
+        response: Response,
         datasource_id: Optional[str] = None,
         dataset_id: Optional[str] = None,
+        page_size: int = Query(VALIDATIONS_PAGE_SIZE, gt=0, le=MAX_VALIDATIONS_PAGE_SIZE),
+        after: Optional[str] = None,
         repository: ValidationRepository = Depends(get_validation_repository),
 ):
     if not dataset_id and not datasource_id:
@@ -23,10 +30,17 @@ def list_validations(
             detail=f"Expected either datasource_id or dataset_id"
         )
 
-    return repository.query_by_filter(
-        datasource_id=datasource_id,
-        dataset_id=dataset_id,
-    )
+    try:
+        validations, search_after = repository.query_by_filter(
+            datasource_id=datasource_id,
+            dataset_id=dataset_id,
+            page_size=page_size,
+            search_after=parse_page_cursor(after),
+        )
+    except RequestError:
+        raise invalid_page_cursor()
+    set_next_page_cursor(response, search_after)
+    return validations
 
 
 @router.get("/statistics", response_model=Stats)
@@ -40,6 +54,7 @@ def validations(
     )
 
     aggs = statistics["aggregations"]
+    windows = aggs["windows"]["buckets"]
 
     validations_dataset = []
     for daily_bucket in aggs["validation_counts"]["buckets"]:
@@ -48,9 +63,9 @@ def validations(
 
     return Stats(
         **{
-            "1_day_avg": aggs["1_day"]["success_counts"]["value"],
-            "7_day_avg": aggs["7_day"]["success_counts"]["value"],
-            "31_day_avg": aggs["31_day"]["success_counts"]["value"],
+            "1_day_avg": windows["1_day"]["success_counts"]["value"],
+            "7_day_avg": windows["7_day"]["success_counts"]["value"],
+            "31_day_avg": windows["31_day"]["success_counts"]["value"],
             "validations": validations_dataset,
         }
     )
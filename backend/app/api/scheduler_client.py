@@ -0,0 +1,9 @@
+import httpx
+
+from app.settings import settings
+
+# Shared by every request so connections to the scheduler are kept alive rather than re-established per call.
+scheduler_client = httpx.AsyncClient(
+    base_url=settings.SCHEDULER_API_URL,
+    limits=httpx.Limits(max_keepalive_connections=32),
+)
@@ -1,23 +1,76 @@
-from fastapi import HTTPException, status
+from typing import Any, Optional
 
+from fastapi import HTTPException, Response, status
+
+from app import utils
 from app.repositories.base import BaseRepository, M, NotFoundError
 
+# Response header holding the cursor of the next page of a paginated list
+NEXT_PAGE_HEADER = "X-Next-Page"
+
 
 def get_by_key_or_404(key: str, repository: BaseRepository[M]) -> M:
     try:
         return repository.get(key)
     except NotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{repository.model_class} with id '{key}' does not exist"
-        )
+        raise _not_found(key, repository)
+
+
+def get_many_by_key_or_404(*items: tuple[str, BaseRepository]) -> list:
+    """
+    Fetches documents that may live in different indices with a single
+    multi-get request. Raises a 404 for the first document that doesn't exist.
+    """
+    client = items[0][1].client
+    response = client.mget(
+        body={"docs": [{"_index": repository.index, "_id": key} for key, repository in items]}
+    )
+
+    objects = []
+    for (key, repository), document in zip(items, response["docs"]):
+        if not document.get("found"):
+            raise _not_found(key, repository)
+        objects.append(repository._get_object_from_dict(document["_source"], id=document["_id"]))
+    return objects
 
 
 def delete_by_key_or_404(key: str, repository: BaseRepository[M]) -> None:
     try:
         repository.delete(key)
     except NotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"{repository.model_class} with id '{key}' does not exist"
-        )
+        raise _not_found(key, repository)
+
+
+def parse_page_cursor(cursor: Optional[str]) -> Optional[list[Any]]:
+    """
+    Reads a cursor sent back from the NEXT_PAGE_HEADER, it holds the search_after values of the page.
+    """
+    if cursor is None:
+        return None
+    try:
+        search_after = utils.json_loads(cursor)
+    except ValueError:
+        search_after = None
+    if not isinstance(search_after, list):
+        raise invalid_page_cursor()
+    return search_after
+
+
+def invalid_page_cursor() -> HTTPException:
+    # Also raised when OpenSearch rejects a cursor that doesn't match the sort, e.g. the wrong number of values
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="invalid page cursor"
+    )
+
+
+def set_next_page_cursor(response: Response, search_after: Optional[list[Any]]) -> None:
+    if search_after is not None:
+        response.headers[NEXT_PAGE_HEADER] = utils.json_dumps(search_after)
+
+
+def _not_found(key: str, repository: BaseRepository) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"{repository.model_class} with id '{key}' does not exist"
+    )
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import get_args
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
@@ -6,6 +7,8 @@ from app.models.expectation import Expectation
 from app.utils import json_schema_to_single_doc
 
 
+# Only depends on the models and on GE's registry, so it is computed once. Callers must not mutate the result.
+@lru_cache(maxsize=None)
 def supported_unsupported_expectations():
     supported_expectations = []
     unsupported_expectations = []
@@ -1,7 +1,9 @@
-import json
 import datetime
+import threading
 import uuid
-from typing import Literal
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Iterator, Literal
 
 from great_expectations.core import ExpectationSuite, ExpectationConfiguration
 from great_expectations.core.batch import RuntimeBatchRequest, BatchRequest
@@ -10,7 +12,8 @@ from great_expectations.data_context.types.base import DataContextConfig, Anonym
 from great_expectations.data_context.types.base import InMemoryStoreBackendDefaults
 from great_expectations.profile.user_configurable_profiler import UserConfigurableProfiler
 from opensearchpy import OpenSearch
-from pandas import isnull
+from numpy import flatnonzero
+from pandas import Series
 
 
 from app import constants as c
@@ -18,6 +21,7 @@ from app import utils
 from app.core.actions import action_dispatcher
 from app.core.expectations import supported_unsupported_expectations
 from app.db.client import client as os_client
+from app.models.base_model import BaseModel
 from app.models.datasource import Engine
 from app.models.validation import Validation
 from app.repositories.dataset import DatasetRepository
@@ -26,9 +30,14 @@ from app.repositories.expectation import ExpectationRepository
 from app.settings import settings
 
 
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+DATETIME_TZ_FORMAT = "%Y-%m-%d %H:%M:%S.%f%z"
+UTC_OFFSET_PATTERN = r"([+-]\d{2})(\d{2})$"
+
+
 class Runner:
     def __init__(self, datasource, batch, meta, dataset_id=None, datasource_id=None, expectations=None,
-                 identifiers=None, excluded_expectations=[]):
+                 identifiers=None, excluded_expectations=None):
         self.identifiers = identifiers
         self.datasource = datasource
         self.batch = batch
@@ -36,59 +45,57 @@ class Runner:
         self.meta = meta
         self.datasource_id = datasource_id
         self.dataset_id = dataset_id
-        self.excluded_expectations = excluded_expectations
+        self.excluded_expectations = excluded_expectations or []
 
     def profile(self):
         assert self.datasource_id is not None, 'Require "datasource_id" when profiling.'
         assert self.dataset_id is not None, 'Require "dataset_id" when profiling.'
 
-        data_context_config = self.get_data_context_config()
-        context = BaseDataContext(project_config=data_context_config)
-        suite: ExpectationSuite = context.create_expectation_suite("default", overwrite_existing=True)
+        with self.data_context() as context:
+            suite: ExpectationSuite = context.create_expectation_suite("default", overwrite_existing=True)
 
-        batch_request = self.get_batch_request(is_profile=True)
+            batch_request = self.get_batch_request(is_profile=True)
 
-        validator = context.get_validator(
-            batch_request=batch_request,
-            expectation_suite=suite,
-        )
+            validator = context.get_validator(
+                batch_request=batch_request,
+                expectation_suite=suite,
+            )
 
-        profiler = UserConfigurableProfiler(
-            validator,
-            excluded_expectations=self.excluded_expectations,
-            value_set_threshold="few",
-        )
-        expectations = profiler.build_suite().to_json_dict()['expectations']
+            profiler = UserConfigurableProfiler(
+                validator,
+                excluded_expectations=self.excluded_expectations,
+                value_set_threshold="few",
+            )
+            expectations = profiler.build_suite().to_json_dict()['expectations']
 
+        now = utils.current_time()
         for expectation in expectations:
-            expectation["kwargs"].update({"result_format": "SUMMARY", "include_config": True, "catch_exceptions": True})
+            kwargs = expectation["kwargs"]
+            kwargs.update({"result_format": "SUMMARY", "include_config": True, "catch_exceptions": True})
 
-            if expectation["kwargs"].get("mostly"):
-                expectation["kwargs"]["objective"] = expectation["kwargs"].pop("mostly")
+            if kwargs.get("mostly"):
+                kwargs["objective"] = kwargs.pop("mostly")
 
-            expectation["kwargs"] = json.dumps(expectation["kwargs"])
+            # kwargs are left as a dict, the expectation models accept both a dict and a JSON string
             expectation["enabled"] = False
             expectation["suggested"] = True
             expectation["datasource_id"] = self.datasource_id
             expectation["dataset_id"] = self.dataset_id
-            expectation["create_date"] = utils.current_time()
-            expectation["modified_date"] = utils.current_time()
+            expectation["create_date"] = now
+            expectation["modified_date"] = now
 
         return expectations
 
     def sample(self):
-        data_context_config = self.get_data_context_config()
-        context = BaseDataContext(project_config=data_context_config)
-
         batch_request = self.get_batch_request()
 
-        suite: ExpectationSuite = context.create_expectation_suite("default", overwrite_existing=True)
-
         try:
-            validator = context.get_validator(
-                batch_request=batch_request, expectation_suite=suite,
-            )
-            head = validator.head()
+            with self.data_context() as context:
+                suite: ExpectationSuite = context.create_expectation_suite("default", overwrite_existing=True)
+                validator = context.get_validator(
+                    batch_request=batch_request, expectation_suite=suite,
+                )
+                head = validator.head()
         except KeyError as ex:
             if self.batch.runtime_parameters:
                 return {"exception": f"Syntax error in query."}
@@ -96,65 +103,84 @@ class Runner:
                 print(str(ex))
                 return {"exception": f"{self.batch.dataset_name} is not recognized."}
 
-        rows = head.to_dict(orient='records')
-        columns = head.columns
+        # Convert column by column rather than cell by cell, to_dict(orient='records') is slow on mixed dtypes
+        columns = list(head.columns)
+        # Positional, head[column] is a DataFrame when a query returns the same column name twice
+        values = [self._sample_column_values(head.iloc[:, i]) for i in range(len(columns))]
+        rows = [dict(zip(columns, row)) for row in zip(*values)]
+        return {'columns': columns, 'rows': rows}
 
-        for record in rows:
-            for column in columns:
-                if isinstance(record[column], datetime.datetime):
-                    record[column] = record[column].__str__()
+    @staticmethod
+    def _sample_column_values(series: Series) -> list:
+        if series.dtype.kind == "M":
+            # Formatted in one vectorized call rather than a datetime.__str__ per cell
+            if series.dt.tz is None:
+                values = series.dt.strftime(DATETIME_FORMAT).tolist()
+            else:
+                # %z renders +0000, datetime.__str__ renders +00:00
+                formatted = series.dt.strftime(DATETIME_TZ_FORMAT)
+                values = formatted.str.replace(UTC_OFFSET_PATTERN, r"\1:\2", regex=True).tolist()
+        elif series.dtype.kind == "O":
+            values = [value.__str__() if isinstance(value, datetime.datetime) else value for value in series.tolist()]
+        else:
+            values = series.tolist()
 
-                if isnull(record[column]):
-                    record[column] = None
-        return {'columns': list(columns), 'rows': rows}
+        # Only revisit the cells that are actually null
+        for i in flatnonzero(series.isna().to_numpy()):
+            values[i] = None
+        return values
 
     def validate(self) -> Validation:
-        data_context_config = self.get_data_context_config()
-        context = BaseDataContext(project_config=data_context_config)
-
-        suite: ExpectationSuite = context.create_expectation_suite("default", overwrite_existing=True)
+        # Shared by every expectation that doesn't have its own meta, GE only reads it
+        if self.batch.runtime_parameters:
+            default_meta = {**self.meta, **self.batch.runtime_parameters.dict(by_alias=True)}
+        else:
+            default_meta = self.meta
 
+        expectation_configurations = []
         for expectation in self.expectations:
-            if self.batch.runtime_parameters:
-                expectation_meta = {**self.meta, **self.batch.runtime_parameters.dict(by_alias=True)}
-            else:
-                expectation_meta = {**self.meta}
-
-            if expectation.get("meta"):
-                expectation_meta = expectation.get("meta")
-
-            if expectation["kwargs"].get("objective"):
-                expectation["kwargs"]["mostly"] = expectation["kwargs"].pop("objective")
+            kwargs = expectation["kwargs"]
+            # Swiple "objective" is synonymous for GE "mostly"
+            if kwargs.get("objective"):
+                kwargs = {("mostly" if key == "objective" else key): value for key, value in kwargs.items()}
 
-            expectation_configuration = ExpectationConfiguration(
+            expectation_configurations.append(ExpectationConfiguration(
                 expectation_type=expectation["expectation_type"],
-                kwargs=expectation["kwargs"],
-                meta=expectation_meta,
-            )
-
-            suite.add_expectation(expectation_configuration=expectation_configuration)
+                kwargs=kwargs,
+                meta=expectation.get("meta") or default_meta,
+            ))
 
         batch_request = self.get_batch_request()
-        validator = context.get_validator(
-            batch_request=batch_request, expectation_suite=suite,
-        )
+        with self.data_context() as context:
+            suite: ExpectationSuite = context.create_expectation_suite("default", overwrite_existing=True)
+            # add_expectation searches the suite for an expectation on the same domain every time,
+            # each expectation is stored separately so they are all validated
+            suite.expectations = expectation_configurations
+
+            validator = context.get_validator(
+                batch_request=batch_request, expectation_suite=suite,
+            )
 
-        validation = validator.validate().to_json_dict()
+            validation = validator.validate().to_json_dict()
         validation["meta"]["run_id"]["run_time"] = utils.remove_t_from_date_string(
             validation["meta"]["run_id"]["run_time"])
         validation["meta"]["run_id"]["run_name"] = str(uuid.uuid4())
         validation["meta"].update(self.identifiers)
 
         for result in validation["results"]:
+            expectation_config = result["expectation_config"]
+            kwargs = expectation_config["kwargs"]
+            result_values = result["result"]
+
             # GE "mostly" is synonymous for Swiple "objective"
-            if result["expectation_config"]["kwargs"].get("mostly"):
-                result["expectation_config"]["kwargs"]["objective"] = result["expectation_config"]["kwargs"].pop("mostly")
+            if kwargs.get("mostly"):
+                kwargs["objective"] = kwargs.pop("mostly")
 
-            if isinstance(result["result"].get("observed_value"), list):
-                result["result"]["observed_value_list"] = result["result"].pop("observed_value")
+            if isinstance(result_values.get("observed_value"), list):
+                result_values["observed_value_list"] = result_values.pop("observed_value")
 
             utils.list_to_string_mapper(result)
-            result["expectation_id"] = result["expectation_config"]["meta"].pop("expectation_id")
+            result["expectation_id"] = expectation_config["meta"].pop("expectation_id")
 
         action_dispatcher.dispatch(
             resource_key=self.identifiers["dataset_id"],
@@ -165,47 +191,31 @@ class Runner:
 
         return Validation(**validation)
 
-    def get_data_context_config(self):
-        connection_string = self._get_connection_string()
-
-        context = DataContextConfig(
-            datasources={
-                self.datasource.datasource_name: {
-                    "class_name": "Datasource",
-                    "module_name": "great_expectations.datasource",
-                    "execution_engine": {
-                        "class_name": "SqlAlchemyExecutionEngine",
-                        "connection_string": connection_string,
-                    },
-                    "data_connectors": {
-                        "default_runtime_data_connector": {
-                            "class_name": "RuntimeDataConnector",
-
-                            # Is there a use-case where this is needed?
-                            # If we require users to add all details for runs in the app then
-                            # using SDK, it pulls values into SDK? This would require batch_identifiers
-                            # for datasources like spark/airflow TODO do this when spark/airflow is added
-                            #
-                            # Alternative is to let users push to ES runs without
-                            # values in app. (Don't like the sound of that...)
-                            "batch_identifiers": [
-                                self.batch.dataset_name
-                            ],
-                        },
-                        "default_inferred_data_connector_name": {
-                            "class_name": "InferredAssetSqlDataConnector",
-                            "include_schema_name": True,
-                        },
-                    }
-                }
-            },
-            store_backend_defaults=InMemoryStoreBackendDefaults(),
-            concurrency={
-                "enabled": True,
-            },
-            anonymous_usage_statistics=AnonymizedUsageStatisticsConfig(enabled=False)
-        )
-        return context
+    @contextmanager
+    def data_context(self) -> Iterator[BaseDataContext]:
+        key = (self.datasource.datasource_name, self._connection_string, self.batch.dataset_name)
+
+        # Runtime queries are loaded into temp tables that only go away with their pooled connection,
+        # and GE runs some dialects on a single connection that is never checked out of the pool again,
+        # so pre-ping can't replace it once the database drops it. Those runs get a throwaway context,
+        # like before contexts were cached.
+        if self.batch.runtime_parameters or _is_single_connection_dialect(self._connection_string):
+            yield _build_data_context(*key)
+            return
+
+        while True:
+            cached = _get_data_context(*key)
+            # The execution engine keeps the batches loaded by a run, so a cached context serves one run at a time
+            with cached.lock:
+                if cached.disposed:
+                    # Evicted while waiting for the lock, fetch a new one
+                    continue
+                try:
+                    yield cached.context
+                finally:
+                    for datasource in cached.context.datasources.values():
+                        datasource.execution_engine.loaded_batch_data_dict.clear()
+                return
 
     def get_batch_request(self, is_profile=True):
         if self.batch.runtime_parameters:
@@ -233,7 +243,8 @@ class Runner:
                 batch_spec_passthrough={"create_temp_table": False},
             )
 
-    def _get_connection_string(self):
+    @cached_property
+    def _connection_string(self) -> str:
         # Snowflake SQLAlchemy connector requires the schema in the connection string in order to create TEMP tables.
         if self.datasource.engine == Engine.SNOWFLAKE and self.batch.runtime_parameters:
             schema = self.batch.runtime_parameters.schema_name
@@ -252,13 +263,84 @@ class Runner:
 
     @staticmethod
     def _get_status(success: bool) -> Literal["success", "failure"]:
-        action_status: Literal["failure"] = "failure"
-        if success:
-            action_status: Literal["success"] = "success"
-        return action_status
+        return "success" if success else "failure"
+
+
+# SqlAlchemyExecutionEngine replaces the engine with a single connection for these dialects
+SINGLE_CONNECTION_DIALECTS = {"sqlite", "mssql", "snowflake", "mysql"}
+
+
+def _is_single_connection_dialect(connection_string: str) -> bool:
+    # The dialect is the URL scheme without its driver, e.g. "mysql" in "mysql+pymysql://..."
+    return connection_string.split(":", 1)[0].split("+", 1)[0] in SINGLE_CONNECTION_DIALECTS
+
+
+class _CachedDataContext:
+    def __init__(self, context: BaseDataContext):
+        self.context = context
+        self.lock = threading.Lock()
+        self.disposed = False
+
+
+def _dispose_data_context(cached: _CachedDataContext):
+    # Wait for a run still using the context rather than closing its connections underneath it
+    with cached.lock:
+        cached.disposed = True
+        for datasource in cached.context.datasources.values():
+            datasource.execution_engine.engine.dispose()
+
+
+# Building a data context is expensive, and it also owns the SQLAlchemy engine and its connection pool,
+# so contexts are reused across runs of the same dataset together with the lock guarding them.
+# Contexts pushed out of the cache have their engines disposed.
+# Use Runner.data_context rather than calling this directly.
+@utils.lru_cache_on_evict(maxsize=32, on_evict=_dispose_data_context)
+def _get_data_context(datasource_name: str, connection_string: str, dataset_name: str) -> _CachedDataContext:
+    return _CachedDataContext(_build_data_context(datasource_name, connection_string, dataset_name))
+
+
+def _build_data_context(datasource_name: str, connection_string: str, dataset_name: str) -> BaseDataContext:
+    config = DataContextConfig(
+        datasources={
+            datasource_name: {
+                "class_name": "Datasource",
+                "module_name": "great_expectations.datasource",
+                "execution_engine": {
+                    "class_name": "SqlAlchemyExecutionEngine",
+                    "connection_string": connection_string,
+                    # Passed to create_engine. Cached contexts check their connections out of the pool for
+                    # every run, so stale ones are replaced. Single connection dialects are never cached.
+                    "pool_pre_ping": True,
+                },
+                "data_connectors": {
+                    "default_runtime_data_connector": {
+                        "class_name": "RuntimeDataConnector",
+
+                        # Is there a use-case where this is needed?
+                        # If we require users to add all details for runs in the app then
+                        # using SDK, it pulls values into SDK? This would require batch_identifiers
+                        # for datasources like spark/airflow TODO do this when spark/airflow is added
+                        #
+                        # Alternative is to let users push to ES runs without
+                        # values in app. (Don't like the sound of that...)
+                        "batch_identifiers": [
+                            dataset_name
+                        ],
+                    },
+                    "default_inferred_data_connector_name": {
+                        "class_name": "InferredAssetSqlDataConnector",
+                        "include_schema_name": True,
+                    },
+                }
+            }
+        },
+        store_backend_defaults=InMemoryStoreBackendDefaults(),
+        anonymous_usage_statistics=AnonymizedUsageStatisticsConfig(enabled=False)
+    )
+    return BaseDataContext(project_config=config)
 
 
-def run_dataset_validation(dataset_id: str, client: OpenSearch = os_client):
+def run_dataset_validation(dataset_id: str, client: OpenSearch = os_client, *, refresh: str = "false"):
     dataset = DatasetRepository(client).get(dataset_id)
     datasource = DatasourceRepository(client).get(dataset.datasource_id)
     expectations = ExpectationRepository(client).query_by_filter(dataset_id=dataset.key, enabled=True)
@@ -273,11 +355,15 @@ def run_dataset_validation(dataset_id: str, client: OpenSearch = os_client):
         "dataset_name": dataset.dataset_name,
     }
 
-    runner_expectations = []
-    for expectation in expectations:
-        runner_expectation = expectation.dict()
-        runner_expectation["meta"] = {"expectation_id": expectation.key}
-        runner_expectations.append(runner_expectation)
+    # Runner.validate only reads these fields, so don't serialize the whole expectation
+    runner_expectations = [
+        {
+            "expectation_type": expectation.expectation_type,
+            "kwargs": expectation.kwargs.dict() if isinstance(expectation.kwargs, BaseModel) else expectation.kwargs,
+            "meta": {"expectation_id": expectation.key},
+        }
+        for expectation in expectations
+    ]
 
     validation = Runner(
         datasource=datasource,
@@ -289,9 +375,11 @@ def run_dataset_validation(dataset_id: str, client: OpenSearch = os_client):
 
     client.index(
         index=settings.VALIDATION_INDEX,
-        id=str(uuid.uuid4()),
+        # run_name is already a fresh uuid4 per run, so reuse it as the document id
+        id=validation.meta.run_id.run_name,
         body=validation.dict(),
-        refresh="wait_for",
+        # Scheduled runs have nobody waiting to read the result, so only wait for a refresh when asked to
+        refresh=refresh,
     )
 
     return validation
@@ -311,8 +399,10 @@ def create_dataset_suggestions(dataset_id: str, client: OpenSearch = os_client):
         "dataset_name": dataset.dataset_name,
     }
 
-    excluded_expectations = supported_unsupported_expectations()["unsupported_expectations"]
-    excluded_expectations.append(c.EXPECT_COLUMN_VALUES_TO_BE_BETWEEN)
+    excluded_expectations = [
+        *supported_unsupported_expectations()["unsupported_expectations"],
+        c.EXPECT_COLUMN_VALUES_TO_BE_BETWEEN,
+    ]
 
     results = Runner(
         datasource=datasource,
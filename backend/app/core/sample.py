@@ -2,11 +2,12 @@ import datetime
 from typing import Any
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import ProgrammingError, OperationalError, DatabaseError
 
 from app.models.dataset import BaseDataset, Sample
 from app.models.datasource import Datasource
-from app.utils import add_limit_clause
+from app.utils import add_limit_clause, json_dumps, json_loads, lru_cache_on_evict
 
 
 class GetSampleException(Exception):
@@ -32,7 +33,7 @@ def get_sample_query_results(query: str, url: str) -> Sample:
     try:
         query = add_limit_clause(query)
 
-        with create_engine(url).connect() as con:
+        with get_engine(url).connect() as con:
             execution = con.execute(query)
             # TODO neaten up
             result_set = []
@@ -56,7 +57,9 @@ def get_sample_query_results(query: str, url: str) -> Sample:
 
             if len(columns) == 0:
                 raise GetSampleException("No columns included in statement.")
-            return Sample(columns=columns, rows=result_set)
+            # Rows hold raw driver values (timedelta, bytes, IP addresses...) that OpenSearch's serializer
+            # doesn't handle, so make them JSON-safe once here rather than on every Sample validation
+            return Sample(columns=columns, rows=json_loads(json_dumps(result_set)))
     except ProgrammingError as e:
         raise GetSampleException(e.orig.pgerror) from e
     except OperationalError as e:
@@ -65,6 +68,13 @@ def get_sample_query_results(query: str, url: str) -> Sample:
         raise GetSampleException(error_msg_from_exception(e)) from e
 
 
+# Reuse engines, and their connection pools, across samples of the same datasource.
+# Engines pushed out of the cache are disposed so their pooled connections are closed.
+@lru_cache_on_evict(maxsize=32, on_evict=Engine.dispose)
+def get_engine(url: str) -> Engine:
+    return create_engine(url, pool_pre_ping=True)
+
+
 def get_columns_and_rows(execution):
     return list(execution.keys()), execution.all()
 
@@ -1,8 +1,36 @@
+import orjson
 from opensearchpy import AsyncOpenSearch, OpenSearch
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.serializer import JSONSerializer
 from app.settings import settings
 from app.models.users import UserDB
 
 
+class ORJSONSerializer(JSONSerializer):
+    """
+    JSONSerializer backed by orjson, which is much faster on large documents like validations.
+    Types orjson doesn't handle natively (e.g. Decimal) fall back to JSONSerializer.default.
+    """
+
+    def loads(self, s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e)
+
+    def dumps(self, data):
+        # don't serialize strings
+        if isinstance(data, str):
+            return data
+
+        try:
+            return orjson.dumps(
+                data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError as e:
+            raise SerializationError(data, e)
+
+
 # Create the client with SSL/TLS enabled, but hostname verification disabled.
 client = OpenSearch(
     hosts=[{"host": settings.OPENSEARCH_HOST, "port": settings.OPENSEARCH_PORT}],
@@ -11,6 +39,8 @@ client = OpenSearch(
     use_ssl=settings.OPENSEARCH_USE_SSL,
     verify_certs=settings.OPENSEARCH_VERIFY_CERTS,
     ssl_show_warn=settings.OPENSEARCH_SSL_SHOW_WARN,
+    maxsize=settings.OPENSEARCH_MAX_CONNECTIONS,
+    serializer=ORJSONSerializer(),
 )
 
 
@@ -21,6 +51,8 @@ async_client = AsyncOpenSearch(
     use_ssl=settings.OPENSEARCH_USE_SSL,
     verify_certs=settings.OPENSEARCH_VERIFY_CERTS,
     ssl_show_warn=settings.OPENSEARCH_SSL_SHOW_WARN,
+    maxsize=settings.OPENSEARCH_MAX_CONNECTIONS,
+    serializer=ORJSONSerializer(),
 )
 
 
@@ -3,9 +3,11 @@ from fastapi import FastAPI
 from app.api.api_v1 import auth_router
 from app.settings import settings
 from app.db.client import client, async_client
+from app.api.scheduler_client import scheduler_client
 import app.constants as c
 from app.core.schedulers.scheduler import scheduler
 from app.api import exception_handlers
+from app.api.shortcuts import NEXT_PAGE_HEADER
 
 app = FastAPI(
     openapi_url=f"{settings.API_VERSION}/openapi.json"
@@ -19,6 +21,7 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_PAGE_HEADER],
     )
 
 app.include_router(auth_router.router, prefix=settings.API_VERSION)
@@ -44,6 +47,7 @@ async def startup():
 async def shutdown():
     await async_client.close()
     client.close()
+    await scheduler_client.aclose()
 
     if settings.APP == c.APP_SCHEDULER:
         scheduler.shutdown()
@@ -0,0 +1,119 @@
+from opensearch_reindexer.base import BaseMigration, Config, Language
+from app.settings import settings
+
+# The mapping of an existing field can't be changed in place, so documents are
+# copied to a temporary index, the datasets index is recreated and they are copied back.
+TEMPORARY_INDEX = f"{settings.DATASET_INDEX}_8"
+
+REINDEX_BODY = {
+    "source": {"index": settings.DATASET_INDEX},
+    "dest": {"index": TEMPORARY_INDEX},
+}
+DESTINATION_INDEX_BODY = {
+    "mappings": {
+        "properties": {
+            "create_date": {
+                "format": "yyyy-MM-dd HH:mm:ss.SSSSSSZZZZZ",
+                "type": "date"
+            },
+            "created_by": {
+                "type": "keyword"
+            },
+            "data_asset_name": {
+                "fielddata": True,
+                "fields": {
+                    "keyword": {
+                        "type": "keyword"
+                    }
+                },
+                "type": "text"
+            },
+            "dataset_name": {
+                "fielddata": True,
+                "fields": {
+                    "keyword": {
+                        "type": "keyword"
+                    }
+                },
+                "type": "text"
+            },
+            "datasource_id": {
+                "type": "keyword"
+            },
+            "engine": {
+                "type": "keyword"
+            },
+            "modified_date": {
+                "format": "yyyy-MM-dd HH:mm:ss.SSSSSSZZZZZ",
+                "type": "date"
+            },
+            "runtime_parameters": {
+                "properties": {
+                    "query": {
+                        "type": "keyword"
+                    },
+                    "schema": {
+                        "type": "keyword"
+                    }
+                },
+                "type": "object"
+            },
+            # Sample rows are stored as native JSON instead of a JSON string.
+            # They are never searched, so they are kept in _source without being indexed.
+            "sample": {
+                "type": "object",
+                "enabled": False
+            }
+        }
+    }
+}
+
+
+# Reindexing runs synchronously, so give it far longer than the client's default timeout.
+REINDEX_REQUEST_TIMEOUT = 3600
+
+
+class Migration(BaseMigration):
+    def before_revision(self):
+        pass
+
+    def reindex_painless(self):
+        self._verified_reindex(REINDEX_BODY)
+
+    def after_revision(self):
+        self.source_client.indices.delete(index=settings.DATASET_INDEX)
+        self.source_client.indices.create(index=settings.DATASET_INDEX, body=DESTINATION_INDEX_BODY)
+        self._verified_reindex({
+            "source": {"index": TEMPORARY_INDEX},
+            "dest": {"index": settings.DATASET_INDEX},
+        })
+        self.source_client.indices.delete(index=TEMPORARY_INDEX)
+
+    def _verified_reindex(self, body: dict):
+        """
+        Reindex and make sure every document reached the destination,
+        since the source index is deleted afterwards.
+        """
+        source_index = body["source"]["index"]
+        expected = self.source_client.count(index=source_index)["count"]
+        response = self.source_client.reindex(
+            body=body,
+            refresh=True,
+            request_timeout=REINDEX_REQUEST_TIMEOUT,
+        )
+        print(response)
+
+        copied = response["created"] + response["updated"]
+        if response["failures"] or copied != expected:
+            raise RuntimeError(
+                f"Reindex from '{source_index}' to '{body['dest']['index']}' copied {copied} "
+                f"of {expected} documents with failures {response['failures']}. "
+                f"'{source_index}' was left in place."
+            )
+
+
+config = Config(
+    reindex_body=REINDEX_BODY,
+    destination_index_body=DESTINATION_INDEX_BODY,
+    language=Language.painless,
+)
@@ -1,5 +1,5 @@
 import uuid
-from pydantic import BaseModel as PydanticBaseModel, Extra, Field
+from pydantic import BaseModel as PydanticBaseModel, Extra, Field, validator
 
 from app.models.types import EncryptedStr
 from app import constants as c
@@ -25,4 +25,9 @@ class KeyModel(PydanticBaseModel):
 
 class CreateUpdateDateModel(PydanticBaseModel):
     create_date: str = Field(default_factory=utils.current_time)
-    modified_date: str = Field(default_factory=utils.current_time)
+    modified_date: str = None
+
+    @validator("modified_date", pre=True, always=True)
+    def default_modified_date_to_create_date(cls, v, values):
+        # A new object is created and modified at the same time
+        return v or values.get("create_date")
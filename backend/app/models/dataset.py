@@ -1,8 +1,8 @@
-import json
 from typing import Any, Optional
 
 from pydantic import Field, constr, validator
 
+from app import utils
 from app.models.base_model import BaseModel, CreateUpdateDateModel, KeyModel
 from app.models.datasource import Engine
 
@@ -24,8 +24,9 @@ class Sample(BaseModel):
 
 	@validator("rows", pre=True)
 	def parse_json_rows(cls, v: Any):
+		# Samples used to be stored as a JSON string
 		if isinstance(v, str):
-			return json.loads(v)
+			return utils.json_loads(v)
 		return v
 
 
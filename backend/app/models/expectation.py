@@ -1,4 +1,3 @@
-import json
 from enum import Enum
 from typing import Annotated, Optional, List, Any, Literal, Union
 
@@ -6,6 +5,7 @@ from pydantic import Field, validator
 
 from app.models.base_model import BaseModel, CreateUpdateDateModel, KeyModel
 from app import constants as c
+from app import utils
 
 
 class IgnoreRowIf(str, Enum):
@@ -33,7 +33,7 @@ class ExpectationBase(BaseModel, KeyModel, CreateUpdateDateModel):
     @validator("kwargs", pre=True)
     def parse_json_kwargs(cls, v: Any):
         if isinstance(v, str):
-            return json.loads(v)
+            return utils.json_loads(v)
         return v
 
     class Config:
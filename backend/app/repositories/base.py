@@ -29,6 +29,34 @@ class BaseRepository(Generic[M]):
             self._get_object_from_dict(result["_source"], id=result["_id"]) for result in results
         ]
 
+    def query_all(self, body: dict[str, Any], *, page_size: int = 500) -> list[M]:
+        """
+        Like query, but pages through every matching document with search_after
+        instead of relying on a single large size. "_seq_no" is appended to the sort as a tiebreaker,
+        unlike "_id" it is backed by doc values. It is unique among the live documents of a shard,
+        and swiple's indices are created with a single shard.
+        """
+        results, search_after = self.query_page(body, size=page_size)
+        while search_after is not None:
+            page, search_after = self.query_page(body, size=page_size, search_after=search_after)
+            results.extend(page)
+        return results
+
+    def query_page(
+        self, body: dict[str, Any], *, size: int, search_after: Optional[list[Any]] = None
+    ) -> tuple[list[M], Optional[list[Any]]]:
+        """
+        A single page of query_all. Returns the page and the search_after values
+        of the next one, None once every matching document has been returned.
+        """
+        body = {**body, "sort": [*body.get("sort", []), {"_seq_no": "asc"}], "track_total_hits": False}
+        if search_after is not None:
+            body["search_after"] = search_after
+
+        hits = self.client.search(index=self.index, size=size, body=body)["hits"]["hits"]
+        page = [self._get_object_from_dict(hit["_source"], id=hit["_id"]) for hit in hits]
+        return page, hits[-1]["sort"] if len(hits) == size else None
+
     def count(self, body: dict[str, Any]) -> int:
         return self.client.count(index=self.index, body=body)["count"]
 
@@ -42,7 +70,7 @@ class BaseRepository(Generic[M]):
     def create(self, id: str, object: M, *, refresh: str = "wait_for") -> M:
         body = self._get_dict_from_object(object, exclude={"key"})
         response = self.client.index(index=self.index, id=id, body=body, refresh=refresh)
-        return self._get_object_from_dict(self._get_dict_from_object(object), id=response["_id"])
+        return self._get_object_from_dict(body, id=response["_id"])
 
     def update(self, id: str, object: M, update_dict: dict[str, Any], *, refresh: str = "wait_for") -> M:
         # Make sure we don't override create_date
@@ -54,17 +82,13 @@ class BaseRepository(Generic[M]):
         if isinstance(object, CreateUpdateDateModel):
             updated_object.modified_date = utils.current_time()
 
+        # The whole document is sent, so it is what OpenSearch will hold and doesn't need to be returned
+        body = self._get_dict_from_object(updated_object, exclude={"key"})
         try:
-            document = self.client.update(
-                index=self.index,
-                id=id,
-                body={"doc": self._get_dict_from_object(updated_object, exclude={"key"})},
-                refresh=refresh,
-                _source=True,
-            )["get"]
+            self.client.update(index=self.index, id=id, body={"doc": body}, refresh=refresh)
         except OSNotFoundError as e:
             raise NotFoundError() from e
-        return self._get_object_from_dict(document["_source"], id=id)
+        return self._get_object_from_dict(body, id=id)
 
     def update_by_query(self, body: dict[str, Any], *, wait_for_completion: bool = True):
         self.client.update_by_query(index=self.index, body=body, wait_for_completion=wait_for_completion)
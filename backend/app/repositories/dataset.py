@@ -1,7 +1,4 @@
-import json
-from typing import Any, Optional
-
-from fastapi.encoders import jsonable_encoder
+from typing import Optional
 
 from app.repositories.base import BaseRepository, get_repository
 from app.models.dataset import Dataset
@@ -12,39 +9,39 @@ class DatasetRepository(BaseRepository[Dataset]):
     model_class = Dataset
     index = settings.DATASET_INDEX
 
-    def query_by_resource_name(
+    def count_by_resource_name(
         self,
         *,
         datasource_name: str,
         schema: str,
         name: str,
         virtual_name: str,
-    ) -> list[Dataset]:
+    ) -> int:
         query = {"query": {"bool": {
             "should": [
                 {
                     "bool": {
-                        "must": [
-                            {"match": {"datasource_name.keyword": datasource_name}},
-                            {"match": {"runtime_parameters.schema": schema}},
-                            {"match": {"dataset_name.keyword": name}},
+                        "filter": [
+                            {"term": {"datasource_name.keyword": datasource_name}},
+                            {"term": {"runtime_parameters.schema": schema}},
+                            {"term": {"dataset_name.keyword": name}},
                         ],
                     }
                 },
                 {
                     "bool": {
-                        "must": [
-                            {"match": {"datasource_name.keyword": datasource_name}},
-                            {"match": {"dataset_name.keyword": virtual_name}},
+                        "filter": [
+                            {"term": {"datasource_name.keyword": datasource_name}},
+                            {"term": {"dataset_name.keyword": virtual_name}},
                         ]
                     }
                 },
             ]
         }}}
-        return self.query(query)
+        return self.count(query)
 
     def delete_by_datasource(self, datasource_id: str):
-        query = {"query": {"match": {"datasource_id": datasource_id}}}
+        query = {"query": {"term": {"datasource_id": datasource_id}}}
         return super().delete_by_query(query)
 
     def update_datasource(self, datasource_id: str, *, database: Optional[str] = None, datasource_name: Optional[str] = None):
@@ -67,7 +64,7 @@ class DatasetRepository(BaseRepository[Dataset]):
             self.client.update_by_query(
                 index=self.index,
                 body={
-                    "query": {"match": {"datasource_id": datasource_id}},
+                    "query": {"term": {"datasource_id": datasource_id}},
                     "script": {
                         "source": update_by_query_string,
                         "lang": "painless"
@@ -76,16 +73,5 @@ class DatasetRepository(BaseRepository[Dataset]):
                 wait_for_completion=True,
             )
 
-    def _get_dict_from_object(self, object: Dataset, **kwargs) -> dict[str, Any]:
-        d = object.dict(by_alias=True, **kwargs)
-        sample = object.sample
-        if sample is not None:
-            sample_dict = {
-                **sample.dict(exclude={"rows"}),
-                "rows": json.dumps(jsonable_encoder(sample.rows)),
-            }
-            d["sample"] = sample_dict
-        return d
-
 
 get_dataset_repository = get_repository(DatasetRepository)
@@ -1,11 +1,21 @@
-import json
-from typing import Any, Optional
+from typing import Any, Optional, get_args
 
+from app import utils
 from app.models.base_model import BaseModel
 from app.repositories.base import BaseRepository, get_repository
 from app.models.expectation import Expectation, ExpectationInput
 from app.settings import settings
 
+# Maps each expectation_type to its model, so stored expectations can be parsed by their
+# own class instead of going through the ExpectationInput discriminated union wrapper.
+EXPECTATION_MODELS = {
+    get_args(expectation.__fields__["expectation_type"].outer_type_)[0]: expectation
+    for expectation in get_args(Expectation)
+}
+
+SORT_ASC = {"sort": [{"expectation_type": "asc"}]}
+SORT_DESC = {"sort": [{"expectation_type": "desc"}]}
+
 
 class ExpectationRepository(BaseRepository[Expectation]):
     model_class = Expectation
@@ -21,19 +31,15 @@ class ExpectationRepository(BaseRepository[Expectation]):
         asc: Optional[bool] = False,
         expectation_type: Optional[str] = None
     ) -> list[Expectation]:
-        direction = "asc" if asc else "desc"
-        sort_by_key: str = "expectation_type"
-        sort = {"sort": [{sort_by_key: direction}]}
-
         query = self._build_query_filter(
             datasource_id=datasource_id,
             dataset_id=dataset_id,
             suggested=suggested,
             enabled=enabled,
             expectation_type=expectation_type,
-            sort=sort,
+            sort=SORT_ASC if asc else SORT_DESC,
         )
-        return super().query(query, size=1000)
+        return self.query_all(query)
 
     def count_by_filter(
         self,
@@ -74,16 +80,22 @@ class ExpectationRepository(BaseRepository[Expectation]):
         return self.delete_by_filter(datasource_id=datasource_id)
 
     def _get_dict_from_object(self, object: Expectation, **kwargs) -> dict[str, Any]:
-        exclude = {"documentation"}.union(kwargs.pop("exclude", set({})))
+        # kwargs are stored as a JSON string, so skip converting them to a dict only to replace it below
+        exclude = {"documentation", "kwargs"}.union(kwargs.pop("exclude", set({})))
         d = object.dict(by_alias=True, exclude=exclude, **kwargs)
         kwargs = object.kwargs
-        d["kwargs"] = kwargs.json() if isinstance(kwargs, BaseModel) else json.dumps(kwargs)
+        d["kwargs"] = kwargs.json() if isinstance(kwargs, BaseModel) else utils.json_dumps(kwargs)
         return d
 
     def _get_object_from_dict(self, d: dict[str, Any], *, id: Optional[str] = None) -> Expectation:
         if id is not None:
             d["key"] = id
-        object = ExpectationInput.parse_obj(d).__root__
+        model = EXPECTATION_MODELS.get(d.get("expectation_type"))
+        if model is None:
+            # Unknown types go through the union so the usual validation error is raised
+            object = ExpectationInput.parse_obj(d).__root__
+        else:
+            object = model.parse_obj(d)
         object.documentation = object._documentation()
         return object
 
@@ -100,22 +112,17 @@ class ExpectationRepository(BaseRepository[Expectation]):
         if sort is None:
             sort = {}
 
-        query = {"query": {"bool": {"must": []}}, **sort}
-
-        if enabled is not None:
-            query["query"]["bool"]["must"].append({"match": {"enabled": enabled}})
-
-        if suggested is not None:
-            query["query"]["bool"]["must"].append({"match": {"suggested": suggested}})
-
-        if datasource_id is not None:
-            query["query"]["bool"]["must"].append({"match": {"datasource_id": datasource_id}})
-
-        if dataset_id is not None:
-            query["query"]["bool"]["must"].append({"match": {"dataset_id": dataset_id}})
-
-        if expectation_type is not None:
-            query["query"]["bool"]["must"].append({"match": {"expectation_type": expectation_type}})
+        filters = (
+            ("enabled", enabled),
+            ("suggested", suggested),
+            ("datasource_id", datasource_id),
+            ("dataset_id", dataset_id),
+            ("expectation_type", expectation_type),
+        )
+        query = {
+            "query": {"bool": {"filter": [{"term": {field: value}} for field, value in filters if value is not None]}},
+            **sort,
+        }
 
         return query
 
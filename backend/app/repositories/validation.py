@@ -6,6 +6,11 @@ from app.models.validation import Validation
 from app.settings import settings
 
 
+VALIDATIONS_PAGE_SIZE = 2000
+# OpenSearch's default index.max_result_window
+MAX_VALIDATIONS_PAGE_SIZE = 10_000
+
+
 class ValidationRepository(BaseRepository[Validation]):
     model_class = Validation
     index = settings.VALIDATION_INDEX
@@ -15,11 +20,18 @@ class ValidationRepository(BaseRepository[Validation]):
         datasource_id: str = None,
         dataset_id: str = None,
         period: int = 14,
-    ):
+        *,
+        page_size: int = VALIDATIONS_PAGE_SIZE,
+        search_after: Optional[list[Any]] = None,
+    ) -> tuple[list[Validation], Optional[list[Any]]]:
+        """
+        Returns a page of validations, oldest first, and the search_after values of the next page.
+        Validations hold every expectation result, so they are never all loaded at once.
+        """
         query = {
             "query": {
                 "bool": {
-                    "must": [
+                    "filter": [
                         {"range": {"meta.run_id.run_time": {"gte": f"now-{period}d", "lte": "now"}}},
                     ]
                 }
@@ -28,12 +40,12 @@ class ValidationRepository(BaseRepository[Validation]):
         }
 
         if dataset_id:
-            query["query"]["bool"]["must"].append({"match": {"meta.dataset_id.keyword": dataset_id}})
+            query["query"]["bool"]["filter"].append({"term": {"meta.dataset_id.keyword": dataset_id}})
 
         if datasource_id:
-            query["query"]["bool"]["must"].append({"match": {"meta.datasource_id.keyword": datasource_id}})
+            query["query"]["bool"]["filter"].append({"term": {"meta.datasource_id.keyword": datasource_id}})
 
-        return super().query(query, size=2000)
+        return self.query_page(query, size=page_size, search_after=search_after)
 
     def delete_by_filter(
         self,
@@ -41,14 +53,21 @@ class ValidationRepository(BaseRepository[Validation]):
         datasource_id: str = None,
         expectation_id: str = None
     ):
-        query = {"query": {"bool": {"must": []}}}
+        # Without any filter the query would match, and delete, every validation
+        if dataset_id is None and datasource_id is None and expectation_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Expected either dataset_id, datasource_id or expectation_id",
+            )
+
+        query = {"query": {"bool": {"filter": []}}}
 
         if dataset_id is not None:
-            query["query"]["bool"]["must"].append({"match": {"meta.dataset_id.keyword": dataset_id}})
+            query["query"]["bool"]["filter"].append({"term": {"meta.dataset_id.keyword": dataset_id}})
         if datasource_id is not None:
-            query["query"]["bool"]["must"].append({"match": {"meta.datasource_id.keyword": datasource_id}})
+            query["query"]["bool"]["filter"].append({"term": {"meta.datasource_id.keyword": datasource_id}})
         if expectation_id is not None:
-            query["query"]["bool"]["must"].append({"match": {"expectation_id": expectation_id}})
+            query["query"]["bool"]["filter"].append({"term": {"expectation_id.keyword": expectation_id}})
 
         return super().delete_by_query(query)
 
@@ -63,40 +82,30 @@ class ValidationRepository(BaseRepository[Validation]):
 
     def statistics(self, dataset_id):
         query = {
+            # Only the aggregations are used, don't fetch any validation documents
+            "size": 0,
+            "track_total_hits": False,
             "query": {
                 "bool": {
-                    "must": [
-                        {"match": {"meta.dataset_id.keyword": dataset_id}},
+                    "filter": [
+                        {"term": {"meta.dataset_id.keyword": dataset_id}},
                         {"range": {"meta.run_id.run_time": {"gte": "now-31d", "lte": "now"}}},
                     ]
                 }
             },
             "aggs": {
-                "31_day": {
-                    "filter": {
-                        "range": {"meta.run_id.run_time": {"gte": "now-31d", "lte": "now"}}
-                    },
-                    "aggs": {
-                        "success_counts": {
-                            "avg": {"field": "statistics.success_percent"}
+                "windows": {
+                    "filters": {
+                        "filters": {
+                            # The query already restricts the validations to the last 31 days
+                            "31_day": {"match_all": {}},
+                            "7_day": {"range": {"meta.run_id.run_time": {"gte": "now-7d", "lte": "now"}}},
+                            "1_day": {"range": {"meta.run_id.run_time": {"gte": "now-1d", "lte": "now"}}},
                         }
-                    }
-                },
-                "7_day": {
-                    "filter": {"range": {"meta.run_id.run_time": {"gte": "now-7d", "lte": "now"}}},
-                    "aggs": {
-                        "success_counts": {
-                            "avg": {"field": "statistics.success_percent"}
-                        }
-                    }
-                },
-                "1_day": {
-                    "filter": {
-                        "range": {"meta.run_id.run_time": {"gte": "now-1d", "lte": "now"}},
                     },
                     "aggs": {
                         "success_counts": {
-                            "avg": {"field": "statistics.success_percent"},
+                            "avg": {"field": "statistics.success_percent"}
                         }
                     }
                 },
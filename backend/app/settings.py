@@ -69,6 +69,9 @@ class Settings(BaseSettings):
     OPENSEARCH_VERIFY_CERTS: bool = Field(default=False)
     OPENSEARCH_USE_SSL: bool = Field(default=True)
     OPENSEARCH_SSL_SHOW_WARN: bool = Field(default=False)
+    # Max connections kept open per OpenSearch node. Should cover the API threadpool
+    # so concurrent requests don't open a new connection (and TLS handshake) each time.
+    OPENSEARCH_MAX_CONNECTIONS: int = Field(default=64)
 
     # OpenSearch Index names
     VERSION_CONTROL_INDEX: str = Field(default="reindexer_version")
@@ -1,4 +1,7 @@
-from typing import Dict, Any
+import functools
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Union
 
 from app.settings import settings
 import datetime
@@ -6,14 +9,28 @@ import emails
 from emails.template import JinjaTemplate
 from pathlib import Path
 import json
+import orjson
 import pytz
 from copy import copy
+from fastapi.encoders import jsonable_encoder
 
 
 def current_time():
     return str(datetime.datetime.utcnow().replace(tzinfo=pytz.utc))
 
 
+def json_dumps(obj: Any) -> str:
+    """
+    Serializes obj to a JSON string using orjson. Types orjson does not
+    support natively (e.g. Decimal) fall back to FastAPI's jsonable_encoder.
+    """
+    return orjson.dumps(obj, default=jsonable_encoder).decode()
+
+
+def json_loads(s: Union[str, bytes]) -> Any:
+    return orjson.loads(s)
+
+
 def remove_t_from_date_string(date_string) -> datetime:
     """
     Converts a date string in the format
@@ -80,17 +97,55 @@ def replace_value_in_dict(item, original_schema):
         return item
 
 
-def list_to_string_mapper(d, sep="."):
-    def recurse(t, parent_key=""):
+def lru_cache_on_evict(maxsize: int, on_evict: Callable[[Any], None]):
+    """
+    Like functools.lru_cache, but values pushed out of the cache are passed to on_evict,
+    e.g. to dispose of a SQLAlchemy engine instead of leaving its pooled connections open.
+    Only supports hashable positional arguments.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            with lock:
+                if args in cache:
+                    cache.move_to_end(args)
+                    return cache[args]
+
+            # Built outside the lock, building a value can be slow (e.g. connecting to a database)
+            value = func(*args)
+
+            with lock:
+                if args in cache:
+                    # Built concurrently by another caller, keep theirs
+                    cache.move_to_end(args)
+                    value, unused = cache[args], value
+                else:
+                    cache[args] = value
+                    unused = cache.popitem(last=False)[1] if len(cache) > maxsize else None
+
+            if unused is not None:
+                on_evict(unused)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def list_to_string_mapper(d):
+    def recurse(t):
         if isinstance(t, list):
-            for i in range(len(t)):
-                recurse(t[i], parent_key + sep + str(i) if parent_key else str(i))
+            for v in t:
+                recurse(v)
         if isinstance(t, dict):
             for k, v in t.items():
                 if isinstance(v, list):
                     t[k] = json.dumps(v)
                 else:
-                    recurse(v, parent_key + sep + k if parent_key else k)
+                    recurse(v)
         elif isinstance(t, (str, bool, int, float, type(None))):
             pass
         else:
@@ -1,3 +1,5 @@
+import functools
+import itertools
 import json
 
 import openmock
@@ -5,10 +7,128 @@ from openmock.utilities import extract_ignore_as_iterable
 from opensearchpy.client.utils import query_params
 from opensearchpy.exceptions import NotFoundError
 
+from app.db.client import ORJSONSerializer
+
 
 class FakeOpenSearch(openmock.FakeOpenSearch):
     """openmock.FakeOpenSearch completed with some missing methods we use."""
 
+    serializer = ORJSONSerializer()
+
+    def _serialize(self, body):
+        # Store documents the way OpenSearch would return them, e.g. Decimals become floats
+        return self.serializer.loads(self.serializer.dumps(body))
+
+    @query_params(
+        "consistency",
+        "op_type",
+        "parent",
+        "refresh",
+        "replication",
+        "routing",
+        "timeout",
+        "timestamp",
+        "ttl",
+        "version",
+        "version_type",
+    )
+    def index(self, index, body, doc_type="_doc", id=None, params=None, headers=None):
+        return super().index(index, self._serialize(body), doc_type=doc_type, id=id, params=params, headers=headers)
+
+    @query_params(
+        "_source",
+        "_source_excludes",
+        "_source_includes",
+        "allow_no_indices",
+        "allow_partial_search_results",
+        "analyze_wildcard",
+        "analyzer",
+        "batched_reduce_size",
+        "default_operator",
+        "df",
+        "docvalue_fields",
+        "expand_wildcards",
+        "explain",
+        "from_",
+        "ignore_unavailable",
+        "lenient",
+        "max_concurrent_shard_requests",
+        "pre_filter_shard_size",
+        "preference",
+        "q",
+        "request_cache",
+        "rest_total_hits_as_int",
+        "routing",
+        "scroll",
+        "search_type",
+        "seq_no_primary_term",
+        "size",
+        "sort",
+        "stats",
+        "stored_fields",
+        "suggest_field",
+        "suggest_mode",
+        "suggest_size",
+        "suggest_text",
+        "terminate_after",
+        "timeout",
+        "track_scores",
+        "track_total_hits",
+        "typed_keys",
+        "version",
+    )
+    def search(self, index=None, doc_type=None, body=None, params=None, headers=None):
+        if not body or "sort" not in body:
+            return super().search(index=index, doc_type=doc_type, body=body, params=params, headers=headers)
+
+        # openmock ignores sort and search_after, apply them to every match before limiting the size
+        size = int(params.pop("size", body.get("size", 10)))
+        body_without_size = {key: value for key, value in body.items() if key != "size"}
+        result = super().search(index=index, doc_type=doc_type, body=body_without_size, params=params, headers=headers)
+        sort = [self._parse_sort(field) for field in body["sort"]]
+        hits = []
+        for hit in result["hits"]["hits"]:
+            # Sequence numbers are handed out the first time a document is searched,
+            # update replaces the document so it gets a new one
+            hit.setdefault("_seq_no", next(self._seq_nos))
+            hits.append({**hit, "sort": [self._get_sort_value(hit, field) for field, _ in sort]})
+
+        hits.sort(key=functools.cmp_to_key(lambda a, b: self._compare_sort_values(a["sort"], b["sort"], sort)))
+        if "search_after" in body:
+            hits = [hit for hit in hits if self._compare_sort_values(hit["sort"], body["search_after"], sort) > 0]
+        result["hits"]["hits"] = hits[:size]
+        return result
+
+    _seq_nos = itertools.count()
+
+    @staticmethod
+    def _parse_sort(field):
+        if isinstance(field, str):
+            return field, "asc"
+        ((name, order),) = field.items()
+        return name, order["order"] if isinstance(order, dict) else order
+
+    @staticmethod
+    def _get_sort_value(hit, field):
+        if field.startswith("_"):
+            return hit.get(field)
+        value = hit["_source"]
+        for key in field.removesuffix(".keyword").split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        return value
+
+    @staticmethod
+    def _compare_sort_values(a, b, sort):
+        for x, y, (_, order) in zip(a, b, sort):
+            if x == y:
+                continue
+            # Missing values are sorted last whatever the order
+            if x is None or y is None:
+                return 1 if x is None else -1
+            result = -1 if x < y else 1
+            return result if order == "asc" else -result
+        return 0
+
     @query_params(
         "allow_no_indices",
         "analyze_wildcard",
@@ -55,6 +175,7 @@ class FakeOpenSearch(openmock.FakeOpenSearch):
         found = False
         result = None
         version = None
+        source = None
         ignore = extract_ignore_as_iterable(params)
 
         if index in self.__documents_dict:
@@ -68,11 +189,12 @@ class FakeOpenSearch(openmock.FakeOpenSearch):
                         version = doc["_version"] + 1
                         self.delete(index, id, doc_type=doc_type)
                         result = "updated"
+                        source = self._serialize(body["doc"])
                         self.__documents_dict[index].append(
                             {
                                 "_type": doc_type,
                                 "_id": id,
-                                "_source": body["doc"],
+                                "_source": source,
                                 "_index": index,
                                 "_version": version,
                             }
@@ -85,7 +207,7 @@ class FakeOpenSearch(openmock.FakeOpenSearch):
             "_version": version,
             "result": result,
             "get": {
-                "_source": body["doc"],
+                "_source": source,
             },
         }
 
@@ -96,6 +218,27 @@ class FakeOpenSearch(openmock.FakeOpenSearch):
         else:
             raise NotFoundError(404, json.dumps(result_dict))
 
+    @query_params(
+        "_source",
+        "_source_excludes",
+        "_source_includes",
+        "preference",
+        "realtime",
+        "refresh",
+        "routing",
+        "stored_fields",
+    )
+    def mget(self, body, index=None, doc_type=None, params=None, headers=None):
+        docs = []
+        for doc in body["docs"]:
+            doc_index = doc.get("_index", index)
+            try:
+                docs.append(self.get(doc_index, doc["_id"], params=params, headers=headers))
+            except NotFoundError:
+                docs.append({"_index": doc_index, "_id": doc["_id"], "found": False})
+
+        return {"docs": docs}
+
     @query_params(
         "_source",
         "_source_excludes",
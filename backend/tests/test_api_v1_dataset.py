@@ -1,4 +1,5 @@
 import datetime
+import ipaddress
 from unittest.mock import MagicMock
 import httpx
 import pytest
@@ -6,8 +7,8 @@ from fastapi import status
 from opensearchpy import OpenSearch, RequestError
 from pydantic.errors import Decimal
 from pytest_mock import MockerFixture
-import requests
 
+from app.api.scheduler_client import scheduler_client
 from app.core.runner import Runner
 from app.core.sample import GetSampleException
 from app.models.dataset import Sample
@@ -102,21 +103,6 @@ class TestListDatasets:
 
         json = response.json()
         assert json == [
-            {
-                "create_date": "2022-10-04 13:37:00.000000+00:00",
-                "modified_date": "2022-10-04 13:37:00.000000+00:00",
-                "key": "5b65eae9-600e-4933-9bad-78477e0ab98e",
-                "datasource_id": "50a58a0b-89e8-4d6f-8b65-6ea328b2cad2",
-                "datasource_name": "postgres",
-                "database": "postgres",
-                "connector_type": "RuntimeDataConnector",
-                "dataset_name": "schema.postgres_table_products",
-                "description": None,
-                "runtime_parameters": None,
-                "engine": "PostgreSQL",
-                "sample": None,
-                "created_by": "admin@email.com",
-            },
             {
                 "create_date": "2022-10-04 13:37:00.000000+00:00",
                 "modified_date": "2022-10-04 13:37:00.000000+00:00",
@@ -147,6 +133,21 @@ class TestListDatasets:
                 "sample": None,
                 "created_by": "admin@email.com",
             },
+            {
+                "create_date": "2022-10-04 13:37:00.000000+00:00",
+                "modified_date": "2022-10-04 13:37:00.000000+00:00",
+                "key": "5b65eae9-600e-4933-9bad-78477e0ab98e",
+                "datasource_id": "50a58a0b-89e8-4d6f-8b65-6ea328b2cad2",
+                "datasource_name": "postgres",
+                "database": "postgres",
+                "connector_type": "RuntimeDataConnector",
+                "dataset_name": "schema.postgres_table_products",
+                "description": None,
+                "runtime_parameters": None,
+                "engine": "PostgreSQL",
+                "sample": None,
+                "created_by": "admin@email.com",
+            },
         ]
 
     @pytest.mark.user
@@ -278,7 +279,7 @@ class TestCreateDataset:
         assert json["engine"] == "PostgreSQL"
         assert json["created_by"] == "admin@email.com"
         assert json["create_date"] is not None
-        assert json["modified_date"] is not None
+        assert json["modified_date"] == json["create_date"]
         assert json["sample"] == {"columns": [], "rows": []}
 
 
@@ -392,9 +393,9 @@ class TestDeleteDataset:
 
     @pytest.mark.user
     async def test_allowed(self, mocker: MockerFixture, test_client: httpx.AsyncClient):
-        # Mock requests.delete request
+        # Mock the scheduler's delete request
         # This shall be removed when we delete the schedules without an HTTP request to our own API
-        mocker.patch.object(requests, "delete", return_value=None)
+        mocker.patch.object(scheduler_client, "delete", return_value=None)
 
         response = await test_client.delete(
             f"/api/v1/datasets/{DATASETS['postgres_table_products'].key}"
@@ -576,6 +577,34 @@ class TestUpdateSample:
             != DATASETS["postgres_table_products"].modified_date
         )
 
+    @pytest.mark.user
+    async def test_sample_non_json_types(
+        self,
+        test_client: httpx.AsyncClient,
+        dataset_repository: DatasetRepository,
+        mock_sa_connection,
+        sample_columns_and_rows
+    ):
+        sample_columns_and_rows.return_value = (
+            ['interval', 'ip_address'],
+            [(datetime.timedelta(hours=1, seconds=30), ipaddress.IPv4Address('10.0.0.1'))],
+        )
+
+        response = await test_client.put(
+            f"/api/v1/datasets/{DATASETS['postgres_table_products'].key}/sample",
+            json={},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        updated_dataset = dataset_repository.get(
+            DATASETS["postgres_table_products"].key
+        )
+        assert updated_dataset.sample == Sample(
+            columns=['interval', 'ip_address'],
+            rows=[{'key': 0, 'interval': 3630.0, 'ip_address': '10.0.0.1'}],
+        )
+
     @pytest.mark.user
     async def test_query_sample(
         self,
@@ -3,9 +3,9 @@ import pytest
 from fastapi import status
 from opensearchpy import OpenSearch, RequestError
 from pytest_mock import MockerFixture
-import requests
 
 from app import constants as c
+from app.api.scheduler_client import scheduler_client
 from app.repositories.datasource import DatasourceRepository
 from tests.data import DATASOURCES
 
@@ -67,20 +67,6 @@ class TestListDatasources:
         json = response.json()
         print(json)
         assert json == [
-            {
-                "create_date": "2022-10-04 13:37:00.000000+00:00",
-                "modified_date": "2022-10-04 13:37:00.000000+00:00",
-                "key": "50a58a0b-89e8-4d6f-8b65-6ea328b2cad2",
-                "engine": "PostgreSQL",
-                "datasource_name": "postgres",
-                "description": None,
-                "created_by": "admin@email.com",
-                "username": "postgres",
-                "password": "*****",
-                "database": "postgres",
-                "host": "postgres",
-                "port": 5432,
-            },
             {
                 "create_date": "2022-10-04 13:37:00.000000+00:00",
                 "modified_date": "2022-10-04 13:37:00.000000+00:00",
@@ -95,6 +81,20 @@ class TestListDatasources:
                 "host": "mysql",
                 "port": 3306,
             },
+            {
+                "create_date": "2022-10-04 13:37:00.000000+00:00",
+                "modified_date": "2022-10-04 13:37:00.000000+00:00",
+                "key": "50a58a0b-89e8-4d6f-8b65-6ea328b2cad2",
+                "engine": "PostgreSQL",
+                "datasource_name": "postgres",
+                "description": None,
+                "created_by": "admin@email.com",
+                "username": "postgres",
+                "password": "*****",
+                "database": "postgres",
+                "host": "postgres",
+                "port": 5432,
+            },
         ]
 
 
@@ -312,9 +312,9 @@ class TestDeleteDatasource:
 
     @pytest.mark.user
     async def test_allowed(self, mocker: MockerFixture, test_client: httpx.AsyncClient):
-        # Mock requests.delete request
+        # Mock the scheduler's delete request
         # This shall be removed when we delete the schedules without an HTTP request to our own API
-        mocker.patch.object(requests, "delete", return_value=None)
+        mocker.patch.object(scheduler_client, "delete", return_value=None)
 
         response = await test_client.delete(
             f"/api/v1/datasources/{DATASOURCES['postgres'].key}"
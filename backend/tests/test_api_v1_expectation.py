@@ -2,10 +2,12 @@ from typing import Any
 import httpx
 import pytest
 from fastapi import status
-from opensearchpy import OpenSearch
+from opensearchpy import OpenSearch, RequestError
+from pytest_mock import MockerFixture
 from app.repositories.base import NotFoundError
 
 from app.repositories.expectation import ExpectationRepository
+from app.repositories.validation import ValidationRepository
 from tests.data import DATASETS, DATASOURCES, EXPECTATIONS
 
 
@@ -167,6 +169,25 @@ class TestListExpectations:
         assert len(json) == nb_results
 
 
+    @pytest.mark.user
+    async def test_history_cursor_rejected_by_opensearch(
+        self, test_client: httpx.AsyncClient, mocker: MockerFixture
+    ):
+        mocker.patch.object(ValidationRepository, "query_by_filter", side_effect=RequestError)
+
+        response = await test_client.get(
+            "/api/v1/expectations/",
+            params={
+                "dataset_id": DATASETS["postgres_table_products"].key,
+                "include_history": True,
+                "history_after": "[1]",
+            },
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["detail"] == "invalid page cursor"
+
+
 @pytest.mark.asyncio
 class TestGetExpectation:
     async def test_unauthorized(self, test_client: httpx.AsyncClient):
@@ -1,7 +1,7 @@
 import httpx
 import pytest
 from fastapi import status
-from opensearchpy import OpenSearch
+from opensearchpy import OpenSearch, RequestError
 from pytest_mock import MockerFixture
 
 from app.main import app
@@ -15,30 +15,19 @@ def validation_repository(mocker: MockerFixture, opensearch_client: OpenSearch):
 
     # FakeOpenSearch is not able to handle complex queries, so we fake them
     mocker.patch.object(
-        repository, "query_by_filter", return_value=list(VALIDATIONS.values())
+        repository, "query_by_filter", return_value=(list(VALIDATIONS.values()), None)
     )
     mocker.patch.object(
         repository,
         "statistics",
         return_value={
             "aggregations": {
-                "31_day": {
-                    "success_counts": {"value": 90},
-                    "doc_count_error_upper_bound": 0,
-                    "sum_other_doc_count": 0,
-                    "buckets": [],
-                },
-                "7_day": {
-                    "success_counts": {"value": 90},
-                    "doc_count_error_upper_bound": 0,
-                    "sum_other_doc_count": 0,
-                    "buckets": [],
-                },
-                "1_day": {
-                    "success_counts": {"value": 90},
-                    "doc_count_error_upper_bound": 0,
-                    "sum_other_doc_count": 0,
-                    "buckets": [],
+                "windows": {
+                    "buckets": {
+                        "31_day": {"doc_count": 10, "success_counts": {"value": 90}},
+                        "7_day": {"doc_count": 5, "success_counts": {"value": 90}},
+                        "1_day": {"doc_count": 1, "success_counts": {"value": 90}},
+                    },
                 },
                 "validation_counts": {
                     "success_counts": {"value": 90},
@@ -179,6 +168,65 @@ class TestListValidations:
         ]
 
 
+    @pytest.mark.user
+    async def test_next_page(self, test_client: httpx.AsyncClient, validation_repository: ValidationRepository):
+        validation_repository.query_by_filter.return_value = (list(VALIDATIONS.values()), [1665000000000, 3])
+
+        response = await test_client.get(
+            "/api/v1/validations/",
+            params={
+                "dataset_id": DATASETS["postgres_table_products"].key,
+                "page_size": 3,
+                "after": "[1664000000000,1]",
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["X-Next-Page"] == "[1665000000000,3]"
+        validation_repository.query_by_filter.assert_called_once_with(
+            datasource_id=None,
+            dataset_id=DATASETS["postgres_table_products"].key,
+            page_size=3,
+            search_after=[1664000000000, 1],
+        )
+
+    @pytest.mark.user
+    async def test_last_page(self, test_client: httpx.AsyncClient):
+        response = await test_client.get(
+            "/api/v1/validations/",
+            params={"dataset_id": DATASETS["postgres_table_products"].key},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "X-Next-Page" not in response.headers
+
+    @pytest.mark.user
+    async def test_invalid_cursor(self, test_client: httpx.AsyncClient):
+        response = await test_client.get(
+            "/api/v1/validations/",
+            params={"dataset_id": DATASETS["postgres_table_products"].key, "after": "not a cursor"},
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["detail"] == "invalid page cursor"
+
+
+    @pytest.mark.user
+    async def test_cursor_rejected_by_opensearch(
+        self, test_client: httpx.AsyncClient, validation_repository: ValidationRepository
+    ):
+        # e.g. a single value for the run_time and tiebreaker sort
+        validation_repository.query_by_filter.side_effect = RequestError
+
+        response = await test_client.get(
+            "/api/v1/validations/",
+            params={"dataset_id": DATASETS["postgres_table_products"].key, "after": "[1]"},
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["detail"] == "invalid page cursor"
+
+
 @pytest.mark.asyncio
 class TestListStatistics:
     async def test_unauthorized(self, test_client: httpx.AsyncClient):
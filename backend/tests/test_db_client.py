@@ -0,0 +1,37 @@
+import datetime
+import decimal
+import uuid
+
+import numpy as np
+import pytest
+from opensearchpy.exceptions import SerializationError
+
+from app.db.client import ORJSONSerializer
+
+
+@pytest.fixture
+def serializer():
+    return ORJSONSerializer()
+
+
+class TestORJSONSerializer:
+    def test_dumps_falls_back_to_default(self, serializer: ORJSONSerializer):
+        data = {"decimal": decimal.Decimal("1.5"), "date": datetime.date(2022, 1, 1), "array": np.array([1, 2])}
+
+        assert serializer.loads(serializer.dumps(data)) == {"decimal": 1.5, "date": "2022-01-01", "array": [1, 2]}
+
+    def test_dumps_passes_strings_through(self, serializer: ORJSONSerializer):
+        assert serializer.dumps('{"already": "serialized"}') == '{"already": "serialized"}'
+
+    def test_dumps_unsupported_type(self, serializer: ORJSONSerializer):
+        with pytest.raises(SerializationError):
+            serializer.dumps({"value": object()})
+
+    def test_loads_invalid_json(self, serializer: ORJSONSerializer):
+        with pytest.raises(SerializationError):
+            serializer.loads("{not json")
+
+    def test_dumps_uuid(self, serializer: ORJSONSerializer):
+        value = uuid.uuid4()
+
+        assert serializer.loads(serializer.dumps({"id": value})) == {"id": str(value)}
@@ -1,5 +1,6 @@
 import pytest
 from opensearchpy import OpenSearch
+from pytest_mock import MockerFixture
 
 from app.repositories.datasource import DatasourceRepository
 from tests.data import DATASOURCES
@@ -14,3 +15,22 @@ class TestRepositoriesDatasource:
     def test_count(self, repository: DatasourceRepository):
         count = repository.count({"query": {}})
         assert count == len(DATASOURCES)
+
+    def test_query_all_pages(self, repository: DatasourceRepository, mocker: MockerFixture):
+        search = mocker.patch.object(repository.client, "search", wraps=repository.client.search)
+
+        datasources = repository.query_all(
+            {"query": {"match_all": {}}, "sort": [{"datasource_name": "asc"}]}, page_size=1
+        )
+
+        assert [datasource.datasource_name for datasource in datasources] == ["mysql", "postgres"]
+        # A last, empty page tells that every document was read
+        assert search.call_count == len(DATASOURCES) + 1
+
+    def test_query_all_tiebreaker(self, repository: DatasourceRepository):
+        # Every document has the same created_by, so pages only continue thanks to the tiebreaker
+        datasources = repository.query_all(
+            {"query": {"match_all": {}}, "sort": [{"created_by": "asc"}]}, page_size=1
+        )
+
+        assert sorted(datasource.key for datasource in datasources) == sorted(d.key for d in DATASOURCES.values())
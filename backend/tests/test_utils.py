@@ -0,0 +1,19 @@
+from unittest.mock import MagicMock
+
+from app.utils import lru_cache_on_evict
+
+
+class TestLruCacheOnEvict:
+    def test_evicts_least_recently_used(self):
+        on_evict = MagicMock()
+        build = MagicMock(side_effect=lambda key: f"value-{key}")
+        cached = lru_cache_on_evict(maxsize=2, on_evict=on_evict)(build)
+
+        assert cached("a") == "value-a"
+        assert cached("b") == "value-b"
+        assert cached("a") == "value-a"
+        on_evict.assert_not_called()
+
+        assert cached("c") == "value-c"
+        on_evict.assert_called_once_with("value-b")
+        assert build.call_count == 3